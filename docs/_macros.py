@@ -1,11 +1,13 @@
 import sys
 from enum import EnumMeta
+from functools import cache, lru_cache
 from importlib import import_module
 from pathlib import Path
 from textwrap import dedent
+from types import CodeType
 from typing import TYPE_CHECKING
 
-from jinja2 import pass_context
+from jinja2 import Template, pass_context
 from qtpy.QtCore import QObject, Signal
 
 if TYPE_CHECKING:
@@ -15,6 +17,27 @@ EXAMPLES = Path(__file__).parent.parent / "examples"
 IMAGES = Path(__file__).parent / "_auto_images"
 IMAGES.mkdir(exist_ok=True, parents=True)
 
+_METHODS_TEMPLATE = Template(
+    dedent(
+        """
+        ## Methods
+
+        ::: {{ cls }}
+            options:
+              heading_level: 3
+              show_source: False
+              show_inherited_members: false
+              show_signature_annotations: True
+              members: {{ members }}
+              docstring_style: numpy
+              show_bases: False
+              show_root_toc_entry: False
+              show_root_heading: False
+        """
+    ),
+    keep_trailing_newline=True,
+)
+
 
 def define_env(env: "MacrosPlugin"):
     @env.macro
@@ -37,18 +60,22 @@ def define_env(env: "MacrosPlugin"):
             )
             src = src.replace("app.exec_()", "")
 
-            exec(src)
+            # keep a reference to the namespace so its widgets live until grabbed
+            namespace = {"__name__": "__example__"}
+            exec(_compile_example(src), namespace)
             _grab(dest, width)
         return (
             f"![{page.title}](../{dest.parent.name}/{dest.name})"
             f"{{ loading=lazy; width={width} }}\n\n"
         )
 
+    # define_env runs on every (re)build, so this cache never outlives a build
     @env.macro
+    @cache
     def show_members(cls: str):
         # import class
         module, name = cls.rsplit(".", 1)
-        _cls = getattr(import_module(module), name)
+        _cls = _cached_import(module, name)
 
         first_q = next(
             (
@@ -59,12 +86,10 @@ def define_env(env: "MacrosPlugin"):
             None,
         )
 
-        inherited_members = set()
+        inherited_members: set[str] = set()
         for base in _cls.__mro__:
             if issubclass(base, QObject) and ".Qt" in base.__module__:
-                inherited_members.update(
-                    {k for k in dir(base) if not k.startswith("_")}
-                )
+                inherited_members.update(_public_names(base))
 
         new_signals = {
             k
@@ -72,11 +97,7 @@ def define_env(env: "MacrosPlugin"):
             if not k.startswith("_") and isinstance(v, Signal)
         }
 
-        self_members = {
-            k
-            for k in dir(_cls)
-            if not k.startswith("_") and k not in inherited_members | new_signals
-        }
+        self_members = set(_public_names(_cls) - inherited_members - new_signals)
 
         enums = []
         for m in list(self_members):
@@ -104,27 +125,29 @@ def define_env(env: "MacrosPlugin"):
                     out += f"- `{m.name}`\n\n"
 
         if self_members:
-            out += dedent(
-                f"""
-            ## Methods
-
-            ::: {cls}
-                options:
-                  heading_level: 3
-                  show_source: False
-                  show_inherited_members: false
-                  show_signature_annotations: True
-                  members: {sorted(self_members)}
-                  docstring_style: numpy
-                  show_bases: False
-                  show_root_toc_entry: False
-                  show_root_heading: False
-            """
-            )
+            out += _METHODS_TEMPLATE.render(cls=cls, members=sorted(self_members))
 
         return out
 
 
+@lru_cache(maxsize=256)
+def _compile_example(src: str) -> CodeType:
+    """Compile the source of a docs example, once per distinct source."""
+    return compile(src, "<example>", "exec")
+
+
+@cache
+def _cached_import(module_name: str, name: str):
+    """Return attribute `name` of module `module_name`, importing it if needed."""
+    return getattr(sys.modules.get(module_name) or import_module(module_name), name)
+
+
+@cache
+def _public_names(obj: type) -> frozenset[str]:
+    """Return the names in `dir(obj)` that don't start with an underscore."""
+    return frozenset(n for n in dir(obj) if n[0] != "_")
+
+
 def _grab(dest: str | Path, width) -> list[Path]:
     """Grab the top widgets of the application."""
     from qtpy.QtCore import QTimer
@@ -1,5 +1,13 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
 from qtpy.QtCore import Qt
-from qtpy.QtGui import QFont, QFontMetrics, QTextLayout
+from qtpy.QtGui import QFont, QTextLayout
+
+if TYPE_CHECKING:
+    from qtpy.QtGui import QFontMetrics
 
 
 class _GenericEliding:
@@ -39,24 +47,13 @@ class _GenericEliding:
 
         Static method.
         """
-        tl = QTextLayout(text, font or QFont())
-        tl.beginLayout()
-        lines = []
-        while True:
-            ln = tl.createLine()
-            if not ln.isValid():
-                break
-            ln.setLineWidth(width)
-            start = ln.textStart()
-            lines.append(text[start : start + ln.textLength()])
-        tl.endLayout()
-        return lines
+        return list(_wrap_text(text, width, font))
 
     # private implementation methods
 
     def _elidedText(self) -> str:
         """Return `self._text` elided to `width`."""
-        fm = QFontMetrics(self.font())
+        fm: QFontMetrics = self.fontMetrics()
         ellipses_width = 0
         if self._elide_mode != Qt.TextElideMode.ElideNone:
             ellipses_width = self._ellipses_width
@@ -65,12 +62,72 @@ class _GenericEliding:
             return fm.elidedText(self._text, self._elide_mode, width)
 
         # get number of lines we can fit without eliding
-        nlines = self.height() // fm.height() - 1
-        # get the last line (elided)
-        text = self._wrappedText()
-        last_line = fm.elidedText("".join(text[nlines:]), self._elide_mode, width)
+        nlines = max(self.height() // fm.height() - 1, 0)
+        if not nlines:
+            return fm.elidedText(self._text, self._elide_mode, width)
+        # only lay out the lines shown in full, the rest goes on the last line
+        head = "".join(self._wrappedText(nlines))
+        last_line = fm.elidedText(self._text[len(head) :], self._elide_mode, width)
         # join them
-        return "".join(text[:nlines] + [last_line])
+        return head + last_line
+
+    def _wrappedText(self, max_lines: int = -1) -> list[str]:
+        return list(_wrap_text(self._text, self.width(), self.font(), max_lines))
+
+
+class _LayoutFont:
+    """Hashable wrapper of a QFont, equal for fonts that lay out text the same.
+
+    `QFont.key()` and `QFont.toString()` leave out the spacing and capitalization
+    attributes, so they are added to the key explicitly.
+    """
+
+    __slots__ = ("font", "key")
+
+    def __init__(self, font: QFont) -> None:
+        self.font = QFont(font)
+        self.key = (
+            font.toString(),
+            font.letterSpacingType(),
+            font.letterSpacing(),
+            font.wordSpacing(),
+            font.capitalization(),
+            font.stretch(),
+            font.kerning(),
+            font.hintingPreference(),
+            font.styleStrategy(),
+        )
+
+    def __hash__(self) -> int:
+        return hash(self.key)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _LayoutFont) and self.key == other.key
+
+
+def _wrap_text(
+    text: str, width: int, font: QFont | None = None, max_lines: int = -1
+) -> tuple[str, ...]:
+    return _wrap_text_cached(text, width, _LayoutFont(font or QFont()), max_lines)
+
+
+@lru_cache(maxsize=128)
+def _wrap_text_cached(
+    text: str, width: int, font: _LayoutFont, max_lines: int = -1
+) -> tuple[str, ...]:
+    """Split `text` as it would be wrapped for `width` with `font`.
 
-    def _wrappedText(self) -> list[str]:
-        return _GenericEliding.wrapText(self._text, self.width(), self.font())
+    If `max_lines` is not negative, layout stops after that many lines.
+    """
+    tl = QTextLayout(text, font.font)
+    tl.beginLayout()
+    lines: list[str] = []
+    while len(lines) != max_lines:
+        ln = tl.createLine()
+        if not ln.isValid():
+            break
+        ln.setLineWidth(width)
+        start = ln.textStart()
+        lines.append(text[start : start + ln.textLength()])
+    tl.endLayout()
+    return tuple(lines)
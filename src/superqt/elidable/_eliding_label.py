@@ -1,5 +1,5 @@
-from qtpy.QtCore import QPoint, QRect, QSize, Qt
-from qtpy.QtGui import QFontMetrics, QResizeEvent
+from qtpy.QtCore import QEvent, QPoint, QRect, QSize, Qt
+from qtpy.QtGui import QResizeEvent
 from qtpy.QtWidgets import QLabel
 
 from ._eliding import _GenericEliding
@@ -21,6 +21,7 @@ class QElidingLabel(_GenericEliding, QLabel):
 
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
+        self._last_elide_width = -1
         if args and isinstance(args[0], str):
             self.setText(args[0])
 
@@ -29,7 +30,7 @@ class QElidingLabel(_GenericEliding, QLabel):
     def setElideMode(self, mode: Qt.TextElideMode) -> None:
         """Set the elide mode to a Qt.TextElideMode."""
         super().setElideMode(mode)
-        super().setText(self._elidedText())
+        self._setElidedText()
 
     def setEllipsesWidth(self, width: int) -> None:
         """A width value to take into account ellipses width when eliding text.
@@ -38,7 +39,7 @@ class QElidingLabel(_GenericEliding, QLabel):
         of the text.
         """
         super().setEllipsesWidth(width)
-        super().setText(self._elidedText())
+        self._setElidedText()
 
     # Reimplemented QT methods
 
@@ -56,27 +57,43 @@ class QElidingLabel(_GenericEliding, QLabel):
         NOTE: we set the QLabel private text to the elided version
         """
         self._text = txt
-        super().setText(self._elidedText())
+        self._setElidedText()
 
     def resizeEvent(self, event: QResizeEvent) -> None:
         event.accept()
-        super().setText(self._elidedText())
+        # without word wrap, the elided text only depends on the width
+        if self.width() == self._last_elide_width and not self.wordWrap():
+            return
+        self._setElidedText()
+
+    def changeEvent(self, event: QEvent) -> None:
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.FontChange:
+            # the elided text depends on the font metrics
+            self._setElidedText()
 
     def setWordWrap(self, wrap: bool) -> None:
         super().setWordWrap(wrap)
-        super().setText(self._elidedText())
+        self._setElidedText()
 
     def sizeHint(self) -> QSize:
         if not self.wordWrap():
             return super().sizeHint()
-        fm = QFontMetrics(self.font())
+        fm = self.fontMetrics()
         flags = int(self.alignment() | Qt.TextFlag.TextWordWrap)
         r = fm.boundingRect(QRect(QPoint(0, 0), self.size()), flags, self._text)
         return QSize(self.width(), r.height())
 
     def minimumSizeHint(self) -> QSize:
         # The smallest that self._elidedText can be is just the ellipsis.
-        fm = QFontMetrics(self.font())
+        fm = self.fontMetrics()
         flags = int(self.alignment() | Qt.TextFlag.TextWordWrap)
         r = fm.boundingRect(QRect(QPoint(0, 0), self.size()), flags, "...")
         return QSize(r.width(), r.height())
+
+    # private implementation methods
+
+    def _setElidedText(self) -> None:
+        """Set the QLabel private text to the elided version of `self._text`."""
+        self._last_elide_width = self.width()
+        super().setText(self._elidedText())
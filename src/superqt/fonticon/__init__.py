@@ -24,6 +24,8 @@ from ._qfont_icon import DEFAULT_SCALING_FACTOR, IconOptionDict, IconOpts
 from ._qfont_icon import QFontIconStore as _QFIS
 
 if TYPE_CHECKING:
+    from os import PathLike
+
     from qtpy.QtGui import QFont, QTransform
     from qtpy.QtWidgets import QWidget
 
@@ -187,7 +189,7 @@ def font(font_prefix: str, size: int | None = None) -> QFont:
 
 
 def addFont(
-    filepath: str, prefix: str, charmap: dict[str, str] | None = None
+    filepath: str | PathLike[str], prefix: str, charmap: dict[str, str] | None = None
 ) -> tuple[str, str] | None:
     """Add OTF/TTF file at `filepath` to the registry under `prefix`.
 
@@ -205,7 +207,7 @@ def addFont(
 
     Parameters
     ----------
-    filepath : str
+    filepath : str | os.PathLike
         Path to an OTF or TTF file containing the fonts
     prefix : str
         A prefix that will represent this font file when used for lookup.  For example,
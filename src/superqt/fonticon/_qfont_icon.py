@@ -1,24 +1,28 @@
 from __future__ import annotations
 
+import keyword
+import os
 import warnings
-from collections import abc, defaultdict
+from collections import abc
 from collections.abc import Sequence
-from dataclasses import dataclass
-from pathlib import Path
-from typing import TYPE_CHECKING, ClassVar, Union, cast
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, TypeVar, Union, cast
 
 from qtpy import QT_VERSION
-from qtpy.QtCore import QObject, QPoint, QRect, QSize, Qt
+from qtpy.QtCore import QObject, QPoint, QPointF, QRect, QSize, QSizeF, Qt
 from qtpy.QtGui import (
     QColor,
     QFont,
     QFontDatabase,
+    QFontMetricsF,
     QGuiApplication,
     QIcon,
     QIconEngine,
     QPainter,
     QPixmap,
     QPixmapCache,
+    QStaticText,
     QTransform,
 )
 from qtpy.QtWidgets import QApplication, QStyleOption, QWidget
@@ -27,8 +31,12 @@ from typing_extensions import TypedDict
 from superqt.utils import QMessageHandler
 
 if TYPE_CHECKING:
+    from functools import _lru_cache_wrapper
+
     from ._animations import Animation
 
+    _C = TypeVar("_C", bound=_lru_cache_wrapper[Any])
+
 
 class Unset:
     def __repr__(self) -> str:
@@ -37,6 +45,24 @@ class Unset:
 
 _Unset = Unset()
 
+# `cache_clear` of the caches that depend on the fonts in QFontIconStore
+_CACHES: list[Callable[[], None]] = []
+# keys of the pixmaps inserted in QPixmapCache by font icons
+_PIXMAP_KEYS: set[str] = set()
+
+
+def _find_pixmap(key: str) -> QPixmap | None:
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", "QPixmapCache.find")
+        return QPixmapCache.find(key)
+
+
+def _store_cache(func: _C) -> _C:
+    """Register `func` to have its cache cleared by `QFontIconStore.clear`."""
+    _CACHES.append(func.cache_clear)
+    return func
+
+
 # A 16 pixel-high icon yields a font size of 14, which is pixel perfect
 # for font-awesome. 16 * 0.875 = 14
 # The reason why the glyph size is smaller than the icon size is to
@@ -72,23 +98,27 @@ def _norm_state_mode(key: StateModeKey) -> tuple[QIcon.State, QIcon.Mode]:
     Strings can be any combination of on, off, normal, active, selected, disabled,
     sep by underscore.
     """
-    _sm: Sequence[StateOrMode]
     if isinstance(key, str):
-        try:
-            _sm = [_SM_MAP[k.lower()] for k in key.split("_")]
-        except KeyError as e:
-            raise ValueError(
-                f"{key!r} is not a valid state key, must be a combination of {{on, "
-                "off, active, disabled, selected, normal} separated by underscore"
-            ) from e
-    else:
-        _sm = key if isinstance(key, abc.Sequence) else [key]
-
+        return _norm_state_mode_str(key)
+    _sm = key if isinstance(key, abc.Sequence) else [key]
     state = next((i for i in _sm if isinstance(i, QIcon.State)), QIcon.State.Off)
     mode = next((i for i in _sm if isinstance(i, QIcon.Mode)), QIcon.Mode.Normal)
     return state, mode
 
 
+@lru_cache
+def _norm_state_mode_str(key: str) -> tuple[QIcon.State, QIcon.Mode]:
+    """Return state/mode tuple for an underscore-separated string `key`."""
+    try:
+        _sm = [_SM_MAP[k.lower()] for k in key.split("_")]
+    except KeyError as e:
+        raise ValueError(
+            f"{key!r} is not a valid state key, must be a combination of {{on, "
+            "off, active, disabled, selected, normal} separated by underscore"
+        ) from e
+    return _norm_state_mode(_sm)
+
+
 class IconOptionDict(TypedDict, total=False):
     glyph_key: str
     scale_factor: float
@@ -145,33 +175,100 @@ class _IconOptions:
     opacity: float = DEFAULT_OPACITY
     animation: Animation | None = None
     transform: QTransform | None = None
+    # (store generation, (char, family, style)) for `glyph_key`, resolved on paint
+    _resolved: tuple[int, tuple[str, str, str | None]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def _glyph(self) -> tuple[str, str, str | None]:
+        """Return (char, family, style) for `glyph_key`."""
+        generation = QFontIconStore._generation
+        if self._resolved is None or self._resolved[0] != generation:
+            glyph = QFontIconStore.key2glyph(self.glyph_key)
+            self._resolved = (QFontIconStore._generation, glyph)
+        return self._resolved[1]
 
     def _update(self, icon_opts: IconOpts) -> _IconOptions:
-        return _IconOptions(**{**vars(self), **icon_opts.dict()})
+        kwargs: dict[str, Any] = {**self.dict(), **icon_opts.dict()}
+        return _IconOptions(**kwargs)
 
     def dict(self) -> IconOptionDict:
         # not using asdict due to pickle errors on animation
-        return cast(IconOptionDict, vars(self))
+        d = {k: v for k, v in vars(self).items() if k != "_resolved"}
+        return cast(IconOptionDict, d)
 
 
-class _QFontIconEngine(QIconEngine):
-    _opt_hash: str = ""
+def _opts_lookup_order(
+    state: QIcon.State, mode: QIcon.Mode
+) -> tuple[tuple[QIcon.State, QIcon.Mode], ...]:
+    """Return the (state, mode) keys to search for the options of `state`/`mode`."""
+    opp_state = QIcon.State.Off if state == QIcon.State.On else QIcon.State.On
+    if mode in (QIcon.Mode.Disabled, QIcon.Mode.Selected):
+        opp_mode = (
+            QIcon.Mode.Disabled if mode == QIcon.Mode.Selected else QIcon.Mode.Selected
+        )
+        order = [
+            (state, mode),
+            (state, QIcon.Mode.Normal),
+            (state, QIcon.Mode.Active),
+            (opp_state, mode),
+            (opp_state, QIcon.Mode.Normal),
+            (opp_state, QIcon.Mode.Active),
+            (state, opp_mode),
+            (opp_state, opp_mode),
+        ]
+    else:
+        opp_mode = QIcon.Mode.Active if mode == QIcon.Mode.Normal else QIcon.Mode.Normal
+        order = [
+            (state, mode),
+            (state, opp_mode),
+            (opp_state, mode),
+            (opp_state, opp_mode),
+            (state, QIcon.Mode.Disabled),
+            (state, QIcon.Mode.Selected),
+            (opp_state, QIcon.Mode.Disabled),
+            (opp_state, QIcon.Mode.Selected),
+        ]
+    return tuple(order)
+
+
+# map of (state, mode) -> (state, mode) keys to search for its options, in order
+_OPTS_LOOKUP_ORDER = {
+    (s, m): _opts_lookup_order(s, m)
+    for s in (QIcon.State.On, QIcon.State.Off)
+    for m in (
+        QIcon.Mode.Normal,
+        QIcon.Mode.Active,
+        QIcon.Mode.Selected,
+        QIcon.Mode.Disabled,
+    )
+}
+
 
+class _QFontIconEngine(QIconEngine):
     def __init__(self, options: _IconOptions):
         super().__init__()
-        self._opts: defaultdict[QIcon.State, dict[QIcon.Mode, _IconOptions | None]] = (
-            defaultdict(dict)
-        )
-        self._opts[QIcon.State.Off][QIcon.Mode.Normal] = options
-        self.update_hash()
+        self._opts: dict[tuple[QIcon.State, QIcon.Mode], _IconOptions] = {
+            (QIcon.State.Off, QIcon.Mode.Normal): options
+        }
+        # map of (family, style, pixel_size) -> QFont
+        self._font_cache: dict[tuple[str, str | None, int], QFont] = {}
+        # QFontIconStore generation the font-dependent caches were built for
+        self._generation = QFontIconStore._generation
+        # map of (state, mode) -> resolved pen color
+        self._colors: dict[tuple[QIcon.State, QIcon.Mode], QColor] = {}
+        # map of (width, height, mode, state) -> (pixmap cache key, styled)
+        self._pmc_keys: dict[tuple[int, int, QIcon.Mode, QIcon.State], tuple[str, bool]]
+        self._pmc_keys = {}
 
     @property
     def _default_opts(self) -> _IconOptions:
-        return cast(_IconOptions, self._opts[QIcon.State.Off][QIcon.Mode.Normal])
+        return self._opts[(QIcon.State.Off, QIcon.Mode.Normal)]
 
     def _add_opts(self, state: QIcon.State, mode: QIcon.Mode, opts: IconOpts) -> None:
-        self._opts[state][mode] = self._default_opts._update(opts)
-        self.update_hash()
+        self._opts[(state, mode)] = self._default_opts._update(opts)
+        self._colors.clear()
+        self._pmc_keys.clear()
 
     def clone(self) -> QIconEngine:  # pragma: no cover
         ico = _QFontIconEngine(self._default_opts)
@@ -179,47 +276,31 @@ class _QFontIconEngine(QIconEngine):
         return ico
 
     def _get_opts(self, state: QIcon.State, mode: QIcon.Mode) -> _IconOptions:
-        opts = self._opts[state].get(mode)
-        if opts:
-            return opts
-
-        opp_state = QIcon.State.Off if state == QIcon.State.On else QIcon.State.On
-        if mode in (QIcon.Mode.Disabled, QIcon.Mode.Selected):
-            opp_mode = (
-                QIcon.Mode.Disabled
-                if mode == QIcon.Mode.Selected
-                else QIcon.Mode.Selected
-            )
-            for m, s in [
-                (QIcon.Mode.Normal, state),
-                (QIcon.Mode.Active, state),
-                (mode, opp_state),
-                (QIcon.Mode.Normal, opp_state),
-                (QIcon.Mode.Active, opp_state),
-                (opp_mode, state),
-                (opp_mode, opp_state),
-            ]:
-                opts = self._opts[s].get(m)
-                if opts:
-                    return opts
-        else:
-            opp_mode = (
-                QIcon.Mode.Active if mode == QIcon.Mode.Normal else QIcon.Mode.Normal
-            )
-            for m, s in [
-                (opp_mode, state),
-                (mode, opp_state),
-                (opp_mode, opp_state),
-                (QIcon.Mode.Disabled, state),
-                (QIcon.Mode.Selected, state),
-                (QIcon.Mode.Disabled, opp_state),
-                (QIcon.Mode.Selected, opp_state),
-            ]:
-                opts = self._opts[s].get(m)
-                if opts:
-                    return opts
+        for key in _OPTS_LOOKUP_ORDER[(state, mode)]:
+            opts = self._opts.get(key)
+            if opts:
+                return opts
         return self._default_opts
 
+    def _get_color(self, state: QIcon.State, mode: QIcon.Mode) -> QColor:
+        """Return the pen color for `state` and `mode`."""
+        color = self._colors.get((state, mode))
+        if color is None:
+            opts_color = self._get_opts(state, mode).color
+            if isinstance(opts_color, tuple):
+                color = QColor(*opts_color)
+            else:
+                color = QColor(opts_color) if opts_color else QColor()
+            self._colors[(state, mode)] = color
+        return color
+
+    def _sync_with_store(self) -> None:
+        """Drop font-dependent caches if the registered fonts changed."""
+        if self._generation != QFontIconStore._generation:
+            self._generation = QFontIconStore._generation
+            self._font_cache.clear()
+            self._pmc_keys.clear()
+
     def paint(
         self,
         painter: QPainter,
@@ -227,22 +308,16 @@ class _QFontIconEngine(QIconEngine):
         mode: QIcon.Mode,
         state: QIcon.State,
     ) -> None:
+        self._sync_with_store()
         opts = self._get_opts(state, mode)
 
-        char, family, style = QFontIconStore.key2glyph(opts.glyph_key)
+        char, family, style = opts._glyph()
 
         # font
-        font = QFont()
-        font.setFamily(family)  # set separately for Qt6
-        font.setPixelSize(round(rect.height() * opts.scale_factor))
-        if style:
-            font.setStyleName(style)
-
-        # color
-        if isinstance(opts.color, tuple):
-            color_args = opts.color
-        else:
-            color_args = (opts.color,) if opts.color else ()
+        font_key = (family, style, round(rect.height() * opts.scale_factor))
+        font = self._font_cache.get(font_key)
+        if font is None:
+            font = self._font_cache[font_key] = _make_font(*font_key)
 
         # animation
         if opts.animation is not None:
@@ -253,21 +328,29 @@ class _QFontIconEngine(QIconEngine):
             painter.setTransform(opts.transform, True)
 
         painter.save()
-        painter.setPen(QColor(*color_args))
+        painter.setPen(self._get_color(state, mode))
         painter.setOpacity(opts.opacity)
         painter.setFont(font)
         with QMessageHandler():  # avoid "Populating font family aliases" warning
-            painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, char)
+            if opts.animation is None and opts.transform is None:
+                # reuse the glyph layout instead of shaping `char` on every paint
+                text, size = _static_text(char, *font_key)
+                # align the way `drawText(rect, AlignCenter, char)` does
+                x = rect.x() + (rect.width() - size.width()) / 2
+                y = rect.y() + (rect.height() - size.height()) / 2
+                painter.drawStaticText(QPointF(x, y), text)
+            else:
+                painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, char)
         painter.restore()
 
     def pixmap(self, size: QSize, mode: QIcon.Mode, state: QIcon.State) -> QPixmap:
         # first look in cache
         pmckey = self._pmcKey(size, mode, state)
-        with warnings.catch_warnings():
-            warnings.filterwarnings("ignore", "QPixmapCache.find")
-            pm = QPixmapCache.find(pmckey) if pmckey else None
+        pm = _find_pixmap(pmckey) if pmckey else None
         if pm:
             return pm
+        # the pixmap may have been evicted from QPixmapCache
+        _PIXMAP_KEYS.discard(pmckey)
         pixmap = QPixmap(size)
         if not size.isValid():
             return pixmap
@@ -277,42 +360,74 @@ class _QFontIconEngine(QIconEngine):
         painter.end()
 
         # Apply palette-based styles for disabled/selected modes
-        # unless the user has specifically set a color for this mode/state
-        if mode != QIcon.Mode.Normal:
-            ico_opts = self._opts[state].get(mode)
-            if not ico_opts or not ico_opts.color:
-                opt = QStyleOption()
-                opt.palette = QGuiApplication.palette()
-                generated = QApplication.style().generatedIconPixmap(mode, pixmap, opt)
-                if not generated.isNull():
-                    pixmap = generated
+        if self._uses_style_pixmap(state, mode):
+            opt = QStyleOption()
+            opt.palette = QGuiApplication.palette()
+            generated = QApplication.style().generatedIconPixmap(mode, pixmap, opt)
+            if not generated.isNull():
+                pixmap = generated
 
         if pmckey and not pixmap.isNull():
             QPixmapCache.insert(pmckey, pixmap)
+            QFontIconStore._track_pixmap_key(pmckey)
 
         return pixmap
 
     def _pmcKey(self, size: QSize, mode: QIcon.Mode, state: QIcon.State) -> str:
-        # Qt6-style enums
-        if self._get_opts(state, mode).animation:
-            return ""
-        if hasattr(mode, "value"):
-            mode = mode.value
-        if hasattr(state, "value"):
-            state = state.value
-        k = ((((((size.width()) << 11) | size.height()) << 11) | mode) << 4) | state
-        return f"$superqt_{self._opt_hash}_{hex(k)}"
-
-    def update_hash(self) -> None:
-        hsh = id(self)
-        for state, d in self._opts.items():
-            for mode, opts in d.items():
-                if not opts:
-                    continue
-                hsh += hash(
-                    hash(opts.glyph_key) + hash(opts.color) + hash(state) + hash(mode)
-                )
-        self._opt_hash = hex(hsh)
+        """Return the QPixmapCache key for the rendered pixmap, empty if uncacheable.
+
+        The key only depends on what ends up in the pixmap, so identical icons
+        share cached pixmaps.
+        """
+        self._sync_with_store()
+        memo_key = (size.width(), size.height(), mode, state)
+        if memo_key not in self._pmc_keys:
+            self._pmc_keys[memo_key] = self._build_pmc_key(size, mode, state)
+        key, styled = self._pmc_keys[memo_key]
+        if styled:
+            # the style pixmap follows the palette, which may change at any time
+            return f"{key}:{QGuiApplication.palette().cacheKey()}"
+        return key
+
+    def _build_pmc_key(
+        self, size: QSize, mode: QIcon.Mode, state: QIcon.State
+    ) -> tuple[str, bool]:
+        """Return the palette-independent part of `_pmcKey` and whether it's styled."""
+        opts = self._get_opts(state, mode)
+        if opts.animation:
+            return "", False
+        char, family, style = opts._glyph()
+        color = self._get_color(state, mode)
+        parts = [
+            "superqt-fi",
+            family,
+            style or "",
+            char,
+            f"{size.width()}x{size.height()}",
+            # Qt6-style enums
+            str(getattr(mode, "value", mode)),
+            str(getattr(state, "value", state)),
+            f"{color.rgba():08x}" if color.isValid() else "",
+            str(opts.scale_factor),
+            str(opts.opacity),
+        ]
+        if opts.transform is not None:
+            t = opts.transform
+            matrix = [t.m11(), t.m12(), t.m13(), t.m21(), t.m22(), t.m23()]
+            matrix += [t.m31(), t.m32(), t.m33()]
+            parts.append(",".join(map(str, matrix)))
+        return ":".join(parts), self._uses_style_pixmap(state, mode)
+
+    def _uses_style_pixmap(self, state: QIcon.State, mode: QIcon.Mode) -> bool:
+        """Whether the pixmap for `state`/`mode` is generated by the app style.
+
+        This is the case for non-normal modes, unless the user has specifically set
+        a color for this mode/state.
+        """
+        if mode == QIcon.Mode.Normal:
+            return False
+        ico_opts = self._opts.get((state, mode))
+        return not ico_opts or not ico_opts.color
 
 
 class QFontIcon(QIcon):
@@ -333,7 +448,7 @@ class QFontIcon(QIcon):
     ) -> None:
         """Set icon options for a specific mode/state."""
         if glyph_key is not _Unset:
-            QFontIconStore.key2glyph(glyph_key)  # type: ignore
+            QFontIconStore.key2glyph(glyph_key)
 
         _opts = IconOpts(
             glyph_key=glyph_key,
@@ -353,6 +468,12 @@ class QFontIconStore(QObject):
     # map of (font_family, font_style) -> character (char may include key)
     _CHARMAPS: ClassVar[dict[tuple[str, str | None], dict[str, str]]] = {}
 
+    # bumped whenever registered fonts change, to invalidate per-icon caches
+    _generation: ClassVar[int] = 0
+
+    # size of _PIXMAP_KEYS above which keys evicted by QPixmapCache are swept out
+    _pixmap_keys_limit: ClassVar[int] = 1024
+
     # singleton instance, use `instance()` to retrieve
     __instance: ClassVar[QFontIconStore | None] = None
 
@@ -372,9 +493,28 @@ class QFontIconStore(QObject):
     def clear(cls) -> None:
         cls._LOADED_KEYS.clear()
         cls._CHARMAPS.clear()
+        for cache_clear in _CACHES:
+            cache_clear()
+        for key in _PIXMAP_KEYS:
+            QPixmapCache.remove(key)
+        _PIXMAP_KEYS.clear()
+        cls._generation += 1
         QFontDatabase.removeAllApplicationFonts()
 
     @classmethod
+    def _track_pixmap_key(cls, key: str) -> None:
+        """Remember `key` so `clear` can remove it, forgetting evicted keys."""
+        _PIXMAP_KEYS.add(key)
+        if len(_PIXMAP_KEYS) > cls._pixmap_keys_limit:
+            _PIXMAP_KEYS.difference_update(
+                [k for k in _PIXMAP_KEYS if not _find_pixmap(k)]
+            )
+            # don't sweep again right away if most pixmaps are still cached
+            cls._pixmap_keys_limit = max(cls._pixmap_keys_limit, 2 * len(_PIXMAP_KEYS))
+
+    @classmethod
+    @_store_cache
+    @lru_cache
     def _key2family(cls, key: str) -> tuple[str, str]:
         """Return (family, style) given a font `key`."""
         key = key.split(".", maxsplit=1)[0]
@@ -398,19 +538,19 @@ class QFontIconStore(QObject):
         return cls._LOADED_KEYS[key]
 
     @classmethod
+    @_store_cache
+    @lru_cache(maxsize=1024)
     def _ensure_char(cls, char: str, family: str, style: str) -> str:
         """Make sure that `char` is a glyph provided by `family` and `style`."""
-        if len(char) == 1 and ord(char) > 256:
-            return char
-        try:
-            charmap = cls._CHARMAPS[(family, style)]
-        except KeyError as e:
-            raise KeyError(
-                f"No charmap registered for font '{family} ({style})'"
-            ) from e
-        if char in charmap:
+        charmap = cls._CHARMAPS.get((family, style))
+        # glyph names are the common case, so look them up first
+        if charmap and char in charmap:
             # split in case the charmap includes the key
             return charmap[char].split(".", maxsplit=1)[-1]
+        if len(char) == 1 and ord(char) > 256:
+            return char
+        if charmap is None:
+            raise KeyError(f"No charmap registered for font '{family} ({style})'")
 
         ident = _ensure_identifier(char)
         if ident in charmap:
@@ -420,6 +560,8 @@ class QFontIconStore(QObject):
         raise ValueError(f"Font '{family} ({style})' has no glyph with the key {ident}")
 
     @classmethod
+    @_store_cache
+    @lru_cache(maxsize=1024)
     def key2glyph(cls, glyph_key: str) -> tuple[str, str, str | None]:
         """Return (char, family, style) given a `glyph_key`."""
         if "." not in glyph_key:
@@ -431,7 +573,10 @@ class QFontIconStore(QObject):
 
     @classmethod
     def addFont(
-        cls, filepath: str, prefix: str, charmap: dict[str, str] | None = None
+        cls,
+        filepath: str | os.PathLike[str],
+        prefix: str,
+        charmap: dict[str, str] | None = None,
     ) -> tuple[str, str] | None:
         r"""Add font at `filepath` to the registry under `key`.
 
@@ -442,7 +587,7 @@ class QFontIconStore(QObject):
 
         Parameters
         ----------
-        filepath : str
+        filepath : str | os.PathLike
             Path to an OTF or TTF file containing the fonts
         prefix : str
             A key that will represent this font file when used for lookup.  For example,
@@ -461,12 +606,12 @@ class QFontIconStore(QObject):
             warnings.warn(f"Prefix {prefix} already loaded", stacklevel=2)
             return None
 
-        if not Path(filepath).exists():
+        if not os.path.exists(filepath):
             raise FileNotFoundError(f"Font file doesn't exist: {filepath}")
         if QApplication.instance() is None:
             raise RuntimeError("Please create QApplication before adding a Font")
 
-        fontId = QFontDatabase.addApplicationFont(str(Path(filepath).absolute()))
+        fontId = QFontDatabase.addApplicationFont(os.path.abspath(filepath))
         if fontId < 0:  # pragma: no cover
             warnings.warn(f"Cannot load font file: {filepath}", stacklevel=2)
             return None
@@ -496,6 +641,10 @@ class QFontIconStore(QObject):
         cls._LOADED_KEYS[prefix] = (family, style)
         if charmap:
             cls._CHARMAPS[(family, style)] = charmap
+            # glyphs cached for a previous charmap of this font may be stale
+            cls._ensure_char.cache_clear()
+            cls.key2glyph.cache_clear()
+            cls._generation += 1
         return (family, style)
 
     def icon(
@@ -521,7 +670,8 @@ class QFontIconStore(QObject):
         icon = QFontIcon(default_opts)
         for kw, options in (states or {}).items():
             if isinstance(options, IconOpts):
-                options = default_opts._update(options).dict()
+                # unset fields are filled from the defaults in `addState`
+                options = options.dict()
             icon.addState(*_norm_state_mode(kw), **options)
         return icon
 
@@ -556,10 +706,42 @@ class QFontIconStore(QObject):
         return font
 
 
+def _make_font(family: str, style: str | None, pixel_size: int) -> QFont:
+    """Create the QFont used to paint glyphs of `family` and `style`."""
+    font = QFont()
+    font.setFamily(family)  # set separately for Qt6
+    font.setPixelSize(pixel_size)
+    if style:
+        font.setStyleName(style)
+    return font
+
+
+@_store_cache
+@lru_cache(maxsize=1024)
+def _static_text(
+    char: str, family: str, style: str | None, pixel_size: int
+) -> tuple[QStaticText, QSizeF]:
+    """Return a prepared QStaticText for `char` and the size it is aligned with.
+
+    The size is the advance and line height `drawText` centers the text with,
+    which can differ from `QStaticText.size()`.
+    """
+    font = _make_font(family, style, pixel_size)
+    text = QStaticText(char)
+    text.setTextFormat(Qt.TextFormat.PlainText)
+    text.setPerformanceHint(QStaticText.PerformanceHint.AggressiveCaching)
+    text.prepare(QTransform(), font)
+    metrics = QFontMetricsF(font)
+    size = QSizeF(metrics.horizontalAdvance(char), metrics.ascent() + metrics.descent())
+    return text, size
+
+
+_DASH_SPACE_TABLE = str.maketrans("- ", "__")
+
+
+@lru_cache(maxsize=2048)
 def _ensure_identifier(name: str) -> str:
     """Normalize string to valid identifier."""
-    import keyword
-
     if not name:
         return ""
 
@@ -572,7 +754,7 @@ def _ensure_identifier(name: str) -> str:
         name += "_"
 
     # replace dashes and spaces with underscores
-    name = name.replace("-", "_").replace(" ", "_")
+    name = name.translate(_DASH_SPACE_TABLE)
 
     if not str.isidentifier(name):
         raise ValueError(f"Could not canonicalize name: {name!r}. (not an identifier)")
@@ -1,7 +1,8 @@
 import platform
 
 from qtpy.QtCore import QSize, Qt
-from qtpy.QtGui import QResizeEvent
+from qtpy.QtGui import QFont, QResizeEvent
+from qtpy.QtWidgets import QLabel
 
 from superqt import QElidingLabel
 
@@ -80,3 +81,94 @@ def test_minimum_size_hint():
     new_hint = wdg.minimumSizeHint()
     assert size_hint.width() == new_hint.width()
     assert size_hint.height() == new_hint.height()
+
+
+def test_wrap_text_cached(qapp):
+    from superqt.elidable._eliding import _wrap_text_cached
+
+    _wrap_text_cached.cache_clear()
+    wrap = QElidingLabel.wrapText(TEXT, 200)
+    assert QElidingLabel.wrapText(TEXT, 200) == wrap
+    assert _wrap_text_cached.cache_info().hits == 1
+    # a different width is a different cache entry
+    assert QElidingLabel.wrapText(TEXT, 400) != wrap
+    assert _wrap_text_cached.cache_info().misses == 2
+
+
+def test_font_change_updates_elided_text(qtbot):
+    wdg = QElidingLabel(TEXT)
+    qtbot.addWidget(wdg)
+    wdg.resize(200, 20)
+    before = QLabel.text(wdg)
+    font = wdg.font()
+    font.setPointSize(font.pointSize() * 3)
+    wdg.setFont(font)
+    assert QLabel.text(wdg) != before
+    assert QLabel.text(wdg).endswith(ELLIPSIS)
+    assert wdg.text() == TEXT
+
+
+def test_resize_same_width_skips_eliding(qtbot, monkeypatch):
+    wdg = QElidingLabel(TEXT)
+    qtbot.addWidget(wdg)
+    wdg.resize(200, 20)
+    wdg.resizeEvent(QResizeEvent(QSize(200, 20), QSize(100, 20)))
+    calls = []
+    original = wdg._elidedText
+    monkeypatch.setattr(wdg, "_elidedText", lambda: calls.append(1) or original())
+    wdg.resize(200, 40)
+    wdg.resizeEvent(QResizeEvent(QSize(200, 40), QSize(200, 20)))
+    assert not calls
+    wdg.resize(300, 40)
+    wdg.resizeEvent(QResizeEvent(QSize(300, 40), QSize(200, 40)))
+    assert len(calls) == 1
+    # with word wrap, the height matters too
+    wdg.setWordWrap(True)
+    wdg.resize(300, 80)
+    wdg.resizeEvent(QResizeEvent(QSize(300, 80), QSize(300, 40)))
+    assert len(calls) == 3
+
+
+def test_resize_while_hidden_updates_elided_text(qtbot):
+    wdg = QElidingLabel()
+    qtbot.addWidget(wdg)
+    wdg.resize(200, 20)
+    wdg.show()
+    qtbot.waitExposed(wdg)
+    wdg.hide()
+    # resize events are held back until the widget is shown again
+    wdg.resize(600, 20)
+    wdg.setText(TEXT)
+    wdg.resize(200, 20)
+    wdg.show()
+    qtbot.waitExposed(wdg)
+    assert wdg.width() == 200
+    assert QLabel.text(wdg) == wdg._elidedText()
+
+
+def test_wrapped_eliding_only_lays_out_visible_lines(qtbot):
+    wdg = QElidingLabel(TEXT)
+    qtbot.addWidget(wdg)
+    wdg.setWordWrap(True)
+    wdg.resize(200, 100)
+    fm = wdg.fontMetrics()
+    nlines = wdg.height() // fm.height() - 1
+    lines = wdg.wrapText(TEXT, wdg.width(), wdg.font())
+    width = wdg.width() - wdg._ellipses_width
+    expected = "".join(lines[:nlines]) + fm.elidedText(
+        "".join(lines[nlines:]), wdg.elideMode(), width
+    )
+    assert wdg._elidedText() == expected
+    assert wdg._wrappedText(nlines) == lines[:nlines]
+
+
+def test_wrap_text_cache_font_identity(qapp):
+    from superqt.elidable._eliding import _wrap_text_cached
+
+    _wrap_text_cached.cache_clear()
+    plain = QFont()
+    spaced = QFont()
+    spaced.setLetterSpacing(QFont.SpacingType.AbsoluteSpacing, 20)
+    assert plain.key() == spaced.key()
+    wrap = QElidingLabel.wrapText(TEXT, 200, plain)
+    assert len(QElidingLabel.wrapText(TEXT, 200, spaced)) > len(wrap)
@@ -1,11 +1,17 @@
 from pathlib import Path
 
 import pytest
-from qtpy.QtGui import QIcon, QPixmap
+from qtpy.QtCore import QSize
+from qtpy.QtGui import QColor, QIcon, QPalette, QPixmap, QPixmapCache, QTransform
 from qtpy.QtWidgets import QPushButton
 
-from superqt.fonticon import icon, pulse, setTextIcon, spin
-from superqt.fonticon._qfont_icon import QFontIconStore, _ensure_identifier
+from superqt.fonticon import IconOpts, _plugins, icon, pulse, setTextIcon, spin
+from superqt.fonticon._qfont_icon import (
+    _PIXMAP_KEYS,
+    QFontIconStore,
+    _ensure_identifier,
+    _norm_state_mode,
+)
 
 TEST_PREFIX = "ico"
 TEST_CHARNAME = "smiley"
@@ -38,6 +44,8 @@ def test_no_charmap(store):
     with pytest.raises(KeyError) as err:
         icon(TEST_GLYPHKEY)
         assert "No charmap registered for" in str(err)
+    # unicode keys don't need a charmap
+    assert isinstance(icon(f"{TEST_PREFIX}.{TEST_CHAR}"), QIcon)
 
 
 def test_font_icon_works(full_store):
@@ -101,8 +109,8 @@ def test_multistate(full_store, qtbot, qapp):
     btn.show()
 
     btn.setEnabled(False)
-    active = icn._engine._opts[QIcon.State.Off][QIcon.Mode.Active].animation.timer
-    disabled = icn._engine._opts[QIcon.State.Off][QIcon.Mode.Disabled].animation.timer
+    active = icn._engine._opts[(QIcon.State.Off, QIcon.Mode.Active)].animation.timer
+    disabled = icn._engine._opts[(QIcon.State.Off, QIcon.Mode.Disabled)].animation.timer
 
     with qtbot.waitSignal(active.timeout, timeout=1000):
         btn.setEnabled(True)
@@ -133,3 +141,182 @@ def test_ensure_identifier():
     assert _ensure_identifier("hello-world") == "hello_world"
     assert _ensure_identifier("hello_world") == "hello_world"
     assert _ensure_identifier("hello world") == "hello_world"
+
+
+def test_key2glyph_cached(full_store):
+    full_store.key2glyph.cache_clear()
+    glyph = full_store.key2glyph(TEST_GLYPHKEY)
+    assert glyph[0] == TEST_CHAR
+    assert full_store.key2glyph(TEST_GLYPHKEY) == glyph
+    assert full_store.key2glyph.cache_info().hits == 1
+    full_store.clear()
+    assert full_store.key2glyph.cache_info().currsize == 0
+    with pytest.raises(KeyError):
+        full_store.key2glyph(TEST_GLYPHKEY)
+
+
+def test_font_cache(full_store):
+    icn = icon(TEST_GLYPHKEY)
+    icn.pixmap(40, 40)
+    icn.pixmap(40, 40, QIcon.Mode.Active)
+    assert len(icn._engine._font_cache) == 1
+    icn.pixmap(20, 20)
+    assert len(icn._engine._font_cache) == 2
+
+
+def test_resolved_color(full_store):
+    icn = icon(TEST_GLYPHKEY, color="blue")
+    icn.pixmap(40, 40)
+    engine = icn._engine
+    assert engine._get_color(QIcon.State.Off, QIcon.Mode.Normal).name() == "#0000ff"
+    # resolving doesn't touch the options
+    assert engine._default_opts.color == "blue"
+    icn.addState(QIcon.State.Off, QIcon.Mode.Normal, color=(255, 0, 0))
+    assert engine._get_color(QIcon.State.Off, QIcon.Mode.Normal).name() == "#ff0000"
+
+
+def test_icon_opts_states(full_store):
+    icn = icon(
+        TEST_GLYPHKEY,
+        color="blue",
+        scale_factor=0.5,
+        states={"active": IconOpts(color="red"), "disabled": {"opacity": 0.5}},
+    )
+    active = icn._engine._opts[(QIcon.State.Off, QIcon.Mode.Active)]
+    assert active.color == "red"
+    assert active.scale_factor == 0.5
+    assert active.glyph_key == TEST_GLYPHKEY
+    disabled = icn._engine._opts[(QIcon.State.Off, QIcon.Mode.Disabled)]
+    assert disabled.color == "blue"
+    assert disabled.opacity == 0.5
+
+
+def test_resolved_glyph(full_store):
+    icn = icon(TEST_GLYPHKEY)
+    opts = icn._engine._default_opts
+    assert opts._resolved is None
+    icn.pixmap(40, 40)
+    assert opts._glyph() == full_store.key2glyph(TEST_GLYPHKEY)
+    assert opts._resolved == (full_store._generation, opts._glyph())
+    # the resolved glyph is not carried over to updated options
+    assert "_resolved" not in opts.dict()
+    assert opts._update(IconOpts(color="red"))._resolved is None
+
+
+def test_pixmap_cache_key(full_store):
+    a = icon(TEST_GLYPHKEY, color="red")._engine
+    b = icon(TEST_GLYPHKEY, color=QColor("red"))._engine
+    c = icon(TEST_GLYPHKEY, color="blue")._engine
+    size, mode, state = QSize(40, 40), QIcon.Mode.Normal, QIcon.State.Off
+    # identical icons share cached pixmaps
+    assert a._pmcKey(size, mode, state) == b._pmcKey(size, mode, state)
+    assert a._pmcKey(size, mode, state) != c._pmcKey(size, mode, state)
+    assert a._pmcKey(size, mode, state) != a._pmcKey(QSize(20, 20), mode, state)
+    assert a._pmcKey(size, mode, state) != a._pmcKey(size, QIcon.Mode.Disabled, state)
+
+
+def test_pixmap_cache_key_memo(full_store, qapp):
+    icn = icon(TEST_GLYPHKEY, color="red")
+    engine = icn._engine
+    size, state = QSize(40, 40), QIcon.State.Off
+    key = engine._pmcKey(size, QIcon.Mode.Normal, state)
+    assert engine._pmcKey(size, QIcon.Mode.Normal, state) is key
+    # new options invalidate the memoized keys
+    icn.addState(state, QIcon.Mode.Normal, color="blue")
+    assert engine._pmcKey(size, QIcon.Mode.Normal, state) != key
+    # styled pixmaps follow the current palette
+    disabled = engine._pmcKey(size, QIcon.Mode.Disabled, state)
+    palette = qapp.palette()
+    qapp.setPalette(QPalette(QColor("green")))
+    try:
+        assert engine._pmcKey(size, QIcon.Mode.Disabled, state) != disabled
+    finally:
+        qapp.setPalette(palette)
+
+
+@pytest.mark.parametrize("scale_factor", [0.5, 0.875, 1.3])
+@pytest.mark.parametrize("size", [13, 16, 21, 32, 37, 48, 64])
+@pytest.mark.parametrize(
+    "module, glyph_key",
+    [
+        ("fonticon_fa5", "fa5s.smile"),
+        ("fonticon_fa5", "fa5b.github"),
+        ("fonticon_mdi6", "mdi6.bell"),
+    ],
+)
+def test_static_text_matches_draw_text(
+    qapp, monkeypatch, module, glyph_key, size, scale_factor
+):
+    pytest.importorskip(module)
+    monkeypatch.setattr(_plugins._manager, "_LOADED", {})
+    opts = {"color": "red", "scale_factor": scale_factor}
+    static = icon(glyph_key, **opts).pixmap(size, size).toImage()
+    # an identity transform forces the `drawText` path
+    drawn = icon(glyph_key, transform=QTransform(), **opts)
+    assert static == drawn.pixmap(size, size).toImage()
+    QFontIconStore.clear()
+
+
+def test_add_font_pathlike(store):
+    assert store.addFont(FONT_FILE, TEST_PREFIX, {TEST_CHARNAME: TEST_CHAR})
+    assert store.key2glyph(TEST_GLYPHKEY)[0] == TEST_CHAR
+    with pytest.raises(FileNotFoundError):
+        store.addFont(FONT_FILE.with_name("missing.ttf"), "missing")
+
+
+def test_clear_removes_cached_pixmaps(full_store):
+    engine = icon(TEST_GLYPHKEY)._engine
+    engine.pixmap(QSize(40, 40), QIcon.Mode.Normal, QIcon.State.Off)
+    key = engine._pmcKey(QSize(40, 40), QIcon.Mode.Normal, QIcon.State.Off)
+    assert key in _PIXMAP_KEYS
+    assert QPixmapCache.find(key)
+    full_store.clear()
+    assert not _PIXMAP_KEYS
+    assert not QPixmapCache.find(key)
+
+
+def test_norm_state_mode():
+    on_selected = (QIcon.State.On, QIcon.Mode.Selected)
+    assert _norm_state_mode("selected_on") == on_selected
+    assert _norm_state_mode("On_Selected") == on_selected
+    assert _norm_state_mode([QIcon.Mode.Selected, QIcon.State.On]) == on_selected
+    assert _norm_state_mode(QIcon.Mode.Active) == (QIcon.State.Off, QIcon.Mode.Active)
+    with pytest.raises(ValueError, match="not a valid state key"):
+        _norm_state_mode("on_bogus")
+
+
+def test_clear_resets_engine_fonts(full_store):
+    engine = icon(TEST_GLYPHKEY)._engine
+    engine.pixmap(QSize(40, 40), QIcon.Mode.Normal, QIcon.State.Off)
+    old_font = next(iter(engine._font_cache.values()))
+    full_store.clear()
+    full_store.addFont(str(FONT_FILE), TEST_PREFIX, {TEST_CHARNAME: TEST_CHAR})
+    engine.pixmap(QSize(40, 40), QIcon.Mode.Normal, QIcon.State.Off)
+    assert len(engine._font_cache) == 1
+    assert next(iter(engine._font_cache.values())) is not old_font
+
+
+def test_evicted_pixmap_keys_are_forgotten(full_store, monkeypatch):
+    engine = icon(TEST_GLYPHKEY)._engine
+    args = (QSize(40, 40), QIcon.Mode.Normal, QIcon.State.Off)
+    engine.pixmap(*args)
+    key = engine._pmcKey(*args)
+    assert key in _PIXMAP_KEYS
+    QPixmapCache.remove(key)  # as if evicted by QPixmapCache
+    # sweeping only keeps the keys of pixmaps that are still cached
+    monkeypatch.setattr(QFontIconStore, "_pixmap_keys_limit", 0)
+    QFontIconStore._track_pixmap_key("superqt-fi:test")
+    assert key not in _PIXMAP_KEYS
+
+
+def test_repaint_after_clear(qapp, monkeypatch):
+    pytest.importorskip("fonticon_fa5")
+    monkeypatch.setattr(_plugins._manager, "_LOADED", {})
+    icn = icon("fa5s.smile", color="red")
+    icn.pixmap(40, 40)
+    QFontIconStore.clear()
+    # the glyph is resolved again, loading the plugin font back in the store
+    after = icn.pixmap(42, 42).toImage()
+    assert "fa5s" in QFontIconStore._LOADED_KEYS
+    assert after == icon("fa5s.smile", color="red").pixmap(42, 42).toImage()
+    QFontIconStore.clear()